@@ -11,10 +11,11 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from flask import Flask, render_template, request, jsonify
-from spell import correct_text, get_backend_info
+from spell import correct_text, suggest_candidates, get_backend_info
+from autocomplete import build_suggestion_index, normalize_prefix, TOP_K
 from typo_analyzer import (
     parse_typo_file, 
-    get_dataset_statistics, 
+    TypoDataset,
     get_random_samples,
     test_correction_accuracy
 )
@@ -27,6 +28,8 @@ app = Flask(__name__,
 import os
 typo_file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'typo.txt')
 TYPO_DICT = parse_typo_file(typo_file_path)
+TYPO_DATASET = TypoDataset.from_dict(TYPO_DICT)
+SUGGESTION_INDEX = build_suggestion_index(TYPO_DICT)
 
 
 @app.route('/')
@@ -55,16 +58,53 @@ def api_correct():
     })
 
 
+@app.route('/api/candidates', methods=['POST'])
+def api_candidates():
+    """API endpoint to list the k best corrections with confidence scores."""
+    data = request.get_json()
+    
+    if not data or 'text' not in data:
+        return jsonify({'error': 'Missing "text" field in request'}), 400
+    
+    try:
+        k = int(data.get('k', 5))
+    except (TypeError, ValueError):
+        return jsonify({'error': '"k" must be an integer'}), 400
+    
+    original_text = data['text']
+    candidates = suggest_candidates(original_text, k)
+    backend = get_backend_info()
+    
+    return jsonify({
+        'original': original_text,
+        'tokens': candidates['tokens'],
+        'phrases': candidates['phrases'],
+        'backend': backend['backend']
+    })
+
+
 @app.route('/api/info', methods=['GET'])
 def api_info():
     """Get information about the correction backend."""
     return jsonify(get_backend_info())
 
 
+@app.route('/api/suggest', methods=['GET'])
+def api_suggest():
+    """Get typo-tolerant autocomplete suggestions for a partial query."""
+    prefix = normalize_prefix(request.args.get('q', ''))
+    limit = request.args.get('limit', TOP_K, type=int)
+    
+    return jsonify({
+        'prefix': prefix,
+        'suggestions': SUGGESTION_INDEX.suggest(prefix, limit)
+    })
+
+
 @app.route('/api/dataset/stats', methods=['GET'])
 def api_dataset_stats():
     """Get statistics about the typo dataset."""
-    stats = get_dataset_statistics(TYPO_DICT)
+    stats = TYPO_DATASET.statistics()
     stats['dataset_name'] = 'typo.txt'
     return jsonify(stats)
 
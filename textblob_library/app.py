@@ -12,10 +12,11 @@ Then visit http://localhost:5000 in your browser.
 """
 
 from flask import Flask, render_template, request, jsonify
-from spell import correct_text, get_backend_info
+from spell import correct_text, suggest_candidates, get_backend_info
+from autocomplete import build_suggestion_index, normalize_prefix, TOP_K
 from typo_analyzer import (
     parse_typo_file, 
-    get_dataset_statistics, 
+    TypoDataset,
     get_random_samples,
     test_correction_accuracy
 )
@@ -24,6 +25,8 @@ app = Flask(__name__)
 
 # Load typo dataset on startup
 TYPO_DICT = parse_typo_file()
+TYPO_DATASET = TypoDataset.from_dict(TYPO_DICT)
+SUGGESTION_INDEX = build_suggestion_index(TYPO_DICT)
 
 
 @app.route('/')
@@ -65,12 +68,86 @@ def api_correct():
     })
 
 
+@app.route('/api/candidates', methods=['POST'])
+def api_candidates():
+    """API endpoint to list the k best corrections with confidence scores.
+    
+    Request JSON:
+        {
+            "text": "text with typos to correct",
+            "k": 5  (optional, default: 5, max: 10)
+        }
+    
+    Response JSON:
+        {
+            "original": "original text",
+            "tokens": [
+                {
+                    "token": "electic",
+                    "start": 12,
+                    "end": 19,
+                    "candidates": [{"text": "electric", "score": 0.95}, ...]
+                },
+                ...
+            ],
+            "phrases": [{"text": "corrected text", "score": 0.95}, ...],
+            "backend": "textblob" or "fallback"
+        }
+    """
+    data = request.get_json()
+    
+    if not data or 'text' not in data:
+        return jsonify({'error': 'Missing "text" field in request'}), 400
+    
+    try:
+        k = int(data.get('k', 5))
+    except (TypeError, ValueError):
+        return jsonify({'error': '"k" must be an integer'}), 400
+    
+    original_text = data['text']
+    candidates = suggest_candidates(original_text, k)
+    backend = get_backend_info()
+    
+    return jsonify({
+        'original': original_text,
+        'tokens': candidates['tokens'],
+        'phrases': candidates['phrases'],
+        'backend': backend['backend']
+    })
+
+
 @app.route('/api/info', methods=['GET'])
 def api_info():
     """Get information about the correction backend."""
     return jsonify(get_backend_info())
 
 
+@app.route('/api/suggest', methods=['GET'])
+def api_suggest():
+    """Get typo-tolerant autocomplete suggestions for a partial query.
+    
+    Query params:
+        q: Prefix typed so far
+        limit: Number of suggestions (default: 10, max: 10)
+    
+    Response JSON:
+        {
+            "prefix": "glaci",
+            "suggestions": [
+                {"text": "glacier", "exact": true},
+                ...
+            ]
+        }
+    """
+    prefix = normalize_prefix(request.args.get('q', ''))
+    limit = request.args.get('limit', TOP_K, type=int)
+    
+    return jsonify({
+        'prefix': prefix,
+        'suggestions': SUGGESTION_INDEX.suggest(prefix, limit)
+    })
+
+
 @app.route('/api/dataset/stats', methods=['GET'])
 def api_dataset_stats():
     """Get statistics about the typo dataset.
@@ -81,11 +158,13 @@ def api_dataset_stats():
             "single_word_typos": 150,
             "multi_word_typos": 250,
             "avg_words_per_typo": 3.2,
+            "avg_edit_distance": 1.6,
             "typo_types": {...},
+            "edit_distance_histogram": [{"distance": 1, "count": 210}, ...],
             "common_words": [...]
         }
     """
-    stats = get_dataset_statistics(TYPO_DICT)
+    stats = TYPO_DATASET.statistics()
     stats['dataset_name'] = 'typo.txt'
     return jsonify(stats)
 
@@ -0,0 +1,233 @@
+"""Typo-tolerant autocomplete over the corrected vocabulary.
+
+Suggestions are served from a compressed prefix trie (radix tree) built from
+the corrected side of the typo dataset and the word model of the active
+spell correction backend. Every node stores its frequency-ranked top
+suggestions, so a lookup only walks the typed prefix and never scans the
+vocabulary. Prefixes of MIN_FUZZY_PREFIX characters or more also match
+with one edit (insertion, deletion, substitution or transposition).
+"""
+
+import heapq
+import re
+
+from spell import get_word_frequencies
+
+
+# Number of suggestions precomputed at every trie node
+TOP_K = 10
+
+# Shortest prefix that is matched with one edit; shorter prefixes would
+# match nearly the whole vocabulary
+MIN_FUZZY_PREFIX = 3
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_prefix(text):
+    """Lowercase text and collapse runs of whitespace to single spaces."""
+    return _WHITESPACE_RE.sub(' ', text.lower()).lstrip()
+
+
+class _Node:
+    """A trie node. Edges map a first character to a (label, child) pair."""
+
+    __slots__ = ('edges', 'weight', 'term', 'top')
+
+    def __init__(self):
+        self.edges = {}
+        self.weight = None
+        self.term = None
+        self.top = ()
+
+
+class PrefixTrie:
+    """Compressed prefix trie with precomputed top-k suggestions per node."""
+
+    def __init__(self, k=TOP_K):
+        self.k = k
+        self._root = _Node()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def insert(self, term, weight):
+        """Add a term, or replace the weight of an existing one.
+
+        Weights may be any comparable values; higher ranks first. Call
+        finalize() after the last insert to rebuild the per-node rankings.
+        """
+        node = self._root
+        i = 0
+        while i < len(term):
+            edge = node.edges.get(term[i])
+            if edge is None:
+                child = _Node()
+                node.edges[term[i]] = (term[i:], child)
+                node = child
+                break
+
+            label, child = edge
+            common = 1
+            limit = min(len(label), len(term) - i)
+            while common < limit and label[common] == term[i + common]:
+                common += 1
+
+            if common < len(label):
+                # Split the edge where the term diverges from its label
+                middle = _Node()
+                middle.edges[label[common]] = (label[common:], child)
+                node.edges[term[i]] = (label[:common], middle)
+                child = middle
+            node = child
+            i += common
+
+        if node.term is None:
+            self._size += 1
+        node.term = term
+        node.weight = weight
+
+    def finalize(self):
+        """Precompute the top-k (weight, term) pairs at every node."""
+        stack = [(self._root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                stack.append((node, True))
+                stack.extend((child, False) for _, child in node.edges.values())
+                continue
+
+            candidates = [pair for _, child in node.edges.values() for pair in child.top]
+            if node.term is not None:
+                candidates.append((node.weight, node.term))
+            node.top = tuple(heapq.nlargest(self.k, candidates))
+
+    def suggest(self, prefix, k=None, fuzzy=True):
+        """Return up to k completions of prefix.
+
+        Args:
+            prefix (str): Normalized prefix, see normalize_prefix()
+            k (int): Maximum number of suggestions (at most the trie's k)
+            fuzzy (bool): Whether to also match the prefix with one edit
+
+        Returns:
+            list: {'text': term, 'exact': bool} dicts, exact matches first
+        """
+        k = self.k if k is None else min(k, self.k)
+        if k <= 0:
+            return []
+
+        root = (self._root, '', 0)
+        reached = {}
+        self._walk(root, prefix, 0, 0, 0, reached)
+
+        suggestions = []
+        seen = set()
+        for node, _ in reached.values():
+            for _, term in node.top[:k]:
+                seen.add(term)
+                suggestions.append({'text': term, 'exact': True})
+
+        # Only pay for the one-edit search when exact matches fall short
+        if len(suggestions) == k or not fuzzy or len(prefix) < MIN_FUZZY_PREFIX:
+            return suggestions
+
+        reached = {}
+        self._walk(root, prefix, 0, 1, 1, reached)
+
+        fuzzy_pairs = (
+            pair
+            for node, used in reached.values() if used
+            for pair in node.top if pair[1] not in seen
+        )
+        for _, term in heapq.nlargest(k - len(suggestions), set(fuzzy_pairs)):
+            suggestions.append({'text': term, 'exact': False})
+        return suggestions
+
+    @staticmethod
+    def _steps(cursor):
+        """Yield (char, cursor) for every character that can follow cursor.
+
+        A cursor (child, label, j) sits j characters into the edge label
+        leading to child; j == len(label) means it sits on child itself.
+        """
+        child, label, j = cursor
+        if j < len(label):
+            yield label[j], (child, label, j + 1)
+        else:
+            for next_label, next_child in child.edges.values():
+                yield next_label[0], (next_child, next_label, 1)
+
+    def _walk(self, cursor, prefix, i, edits, budget, reached):
+        """Collect the subtrees whose paths match prefix[i:] within edits."""
+        if i == len(prefix):
+            node = cursor[0]
+            used = budget - edits
+            if id(node) not in reached or used < reached[id(node)][1]:
+                reached[id(node)] = (node, used)
+            return
+
+        char = prefix[i]
+        for step_char, step in self._steps(cursor):
+            if step_char == char:
+                self._walk(step, prefix, i + 1, edits, budget, reached)
+            elif edits:
+                # Substitution
+                self._walk(step, prefix, i + 1, edits - 1, budget, reached)
+
+        if not edits:
+            return
+
+        # Extra character typed
+        self._walk(cursor, prefix, i + 1, edits - 1, budget, reached)
+        # Missing character
+        for _, step in self._steps(cursor):
+            self._walk(step, prefix, i, edits - 1, budget, reached)
+        # Adjacent characters swapped
+        if i + 1 < len(prefix) and prefix[i + 1] != char:
+            for step_char, step in self._steps(cursor):
+                if step_char != prefix[i + 1]:
+                    continue
+                for next_char, next_step in self._steps(step):
+                    if next_char == char:
+                        self._walk(next_step, prefix, i + 2, edits - 1, budget, reached)
+
+
+def build_suggestion_index(typo_dict, word_frequencies=None, k=TOP_K):
+    """Build a PrefixTrie from the corrected side of the typo dataset.
+
+    Corrected phrases and their words are ranked by how often they occur
+    in the dataset, ahead of words that are only known to the word model,
+    which are ranked by their model frequency.
+
+    Args:
+        typo_dict (dict): 'typo': 'correct' pairs, see parse_typo_file()
+        word_frequencies (dict): word -> count, defaults to the backend model
+        k (int): Number of suggestions precomputed per node
+
+    Returns:
+        PrefixTrie: Finalized trie
+    """
+    if word_frequencies is None:
+        word_frequencies = get_word_frequencies()
+
+    dataset_counts = {}
+    for correct in typo_dict.values():
+        phrase = normalize_prefix(correct).rstrip()
+        if not phrase:
+            continue
+        dataset_counts[phrase] = dataset_counts.get(phrase, 0) + 1
+        if ' ' in phrase:
+            for word in phrase.split(' '):
+                dataset_counts[word] = dataset_counts.get(word, 0) + 1
+
+    trie = PrefixTrie(k)
+    for word, count in word_frequencies.items():
+        word = word.lower()
+        if word and word not in dataset_counts:
+            trie.insert(word, (0, count))
+    for term, count in dataset_counts.items():
+        trie.insert(term, (count, word_frequencies.get(term, 0)))
+    trie.finalize()
+    return trie
@@ -3,10 +3,19 @@
 This module provides spell correction capabilities, preferring TextBlob
 when available, and falling back to a dictionary-based approach with
 difflib for similarity matching.
+
+Both backends share a single regex tokenizer: only alphabetic words are
+handed to the word-level corrector, while offsets, case and punctuation
+of the original text are preserved.
 """
 
+import heapq
+import math
+import re
+
 try:
-    from textblob import TextBlob
+    from textblob import Word
+    from textblob.en import spelling as TEXTBLOB_SPELLING
     TEXTBLOB_AVAILABLE = True
 except ImportError:
     TEXTBLOB_AVAILABLE = False
@@ -34,6 +43,21 @@ CORRECTION_MAP = {
     'florescent': 'fluorescent',
 }
 
+# Single-word entries of CORRECTION_MAP, used for word-level fallback lookups
+WORD_CORRECTIONS = {
+    typo: correct for typo, correct in CORRECTION_MAP.items() if ' ' not in typo
+}
+
+# Standalone alphabetic words (optionally with inner apostrophes). Tokens glued
+# to digits or underscores, such as model numbers like "g135", are not matched.
+_WORD_RE = re.compile(r"(?<![\w'])[A-Za-z]+(?:'[A-Za-z]+)*(?![\w'])")
+
+# Minimum similarity for a fallback dictionary match
+FALLBACK_CUTOFF = 0.8
+
+# Upper bound for the number of candidates per word or phrase
+MAX_CANDIDATES = 10
+
 
 def correct_text(text):
     """Correct spelling in the given text.
@@ -54,9 +78,8 @@ def correct_text(text):
 
 
 def _correct_with_textblob(text):
-    """Correct text using TextBlob library."""
-    blob = TextBlob(text)
-    return str(blob.correct())
+    """Correct text using TextBlob's word-level spellchecker."""
+    return _correct_tokens(text, _correct_word_textblob)
 
 
 def _correct_with_fallback(text):
@@ -66,23 +89,242 @@ def _correct_with_fallback(text):
     if text_lower in CORRECTION_MAP:
         return CORRECTION_MAP[text_lower]
     
-    # Try word-by-word correction
-    words = text.split()
-    corrected_words = []
-    
-    for word in words:
-        word_lower = word.lower()
-        if word_lower in CORRECTION_MAP:
-            corrected_words.append(CORRECTION_MAP[word_lower])
-        else:
-            # Try to find close matches in our dictionary
-            matches = difflib.get_close_matches(word_lower, CORRECTION_MAP.keys(), n=1, cutoff=0.8)
-            if matches:
-                corrected_words.append(CORRECTION_MAP[matches[0]])
-            else:
-                corrected_words.append(word)
-    
-    return ' '.join(corrected_words)
+    return _correct_tokens(text, _correct_word_fallback)
+
+
+def _correct_word_textblob(word):
+    """Return TextBlob's best correction for a lowercase word."""
+    return _candidates_textblob(word, 1)[0][0]
+
+
+def _correct_word_fallback(word):
+    """Return the dictionary correction for a lowercase word, if any."""
+    return _candidates_fallback(word, 1)[0][0]
+
+
+def _candidates_textblob(word, k):
+    """Return TextBlob's k most probable (correction, score) pairs for a word.
+    
+    Scores are TextBlob's word probabilities, normalized over all of the
+    candidates it generated. A word TextBlob knows nothing about comes back
+    as its own only candidate with probability 0, which is scored 1 instead
+    so that it does not zero out every phrase containing it.
+    """
+    pairs = Word(word).spellcheck()
+    if len(pairs) == 1:
+        return [(pairs[0][0], 1.0)]
+    return heapq.nlargest(k, pairs, key=lambda pair: pair[1])
+
+
+def _candidates_fallback(word, k):
+    """Return up to k (correction, score) pairs for a word from the dictionary.
+    
+    Dictionary words within FALLBACK_CUTOFF similarity are kept in a bounded
+    heap; the word itself stays a candidate with the remaining confidence.
+    Scores are normalized to sum to 1.
+    """
+    if word in WORD_CORRECTIONS:
+        return [(WORD_CORRECTIONS[word], 1.0)]
+    
+    # Same filters as difflib.get_close_matches, cheapest first
+    matcher = difflib.SequenceMatcher()
+    matcher.set_seq2(word)
+    heap = []
+    for typo in WORD_CORRECTIONS:
+        matcher.set_seq1(typo)
+        if (matcher.real_quick_ratio() >= FALLBACK_CUTOFF
+                and matcher.quick_ratio() >= FALLBACK_CUTOFF):
+            ratio = matcher.ratio()
+            if ratio >= FALLBACK_CUTOFF:
+                if len(heap) < k:
+                    heapq.heappush(heap, (ratio, typo))
+                else:
+                    heapq.heappushpop(heap, (ratio, typo))
+    
+    scores = {}
+    for ratio, typo in heap:
+        correct = WORD_CORRECTIONS[typo]
+        scores[correct] = max(scores.get(correct, 0.0), ratio)
+    best = max(scores.values(), default=0.0)
+    scores.setdefault(word, 1.0 - best)
+    
+    total = sum(scores.values())
+    pairs = [(correct, score / total) for correct, score in scores.items()]
+    return heapq.nlargest(k, pairs, key=lambda pair: pair[1])
+
+
+def _iter_words(text):
+    """Yield a match for every alphabetic word in text worth correcting.
+    
+    ALL-CAPS words such as acronyms and brand names (PVC, GFCI, DEWALT) are
+    left alone, as TextBlob itself never corrects them.
+    """
+    for match in _WORD_RE.finditer(text):
+        word = match.group()
+        if word.isalpha() and len(word) > 1 and not word.isupper():
+            yield match
+
+
+def _correct_tokens(text, correct_word):
+    """Correct each alphabetic word in text, leaving everything else intact.
+    
+    Args:
+        text (str): Input text
+        correct_word (callable): Maps a lowercase word to its correction
+        
+    Returns:
+        str: Text with corrected words spliced in at their original offsets
+    """
+    replacements = []
+    corrections = {}
+    
+    for match in _iter_words(text):
+        word = match.group()
+        key = word.lower()
+        corrected = corrections.get(key)
+        if corrected is None:
+            # Repeated words are only corrected once per text
+            corrected = corrections[key] = correct_word(key)
+        if corrected != key:
+            replacements.append((match.start(), match.end(), _match_case(word, corrected)))
+    
+    return _splice(text, replacements)
+
+
+def _splice(text, replacements):
+    """Replace (start, end, new) spans of text, given in ascending order."""
+    if not replacements:
+        return text
+    
+    pieces = []
+    last = 0
+    for start, end, new in replacements:
+        pieces.append(text[last:start])
+        pieces.append(new)
+        last = end
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
+
+def _match_case(original, corrected):
+    """Apply the capitalization of original to corrected."""
+    if original[0].isupper():
+        return corrected[0].upper() + corrected[1:]
+    return corrected
+
+
+def suggest_candidates(text, k=5):
+    """Suggest the k best corrections for each word and for the whole text.
+    
+    Candidates for every distinct word are generated once; the phrase-level
+    suggestions are the k highest-scoring combinations of those candidates.
+    
+    Args:
+        text (str): Input text with potential typos
+        k (int): Number of candidates per word and per phrase (max 10)
+        
+    Returns:
+        dict: {'tokens': [...], 'phrases': [...]} where each token carries its
+            text, offsets and candidates, and every candidate is a
+            {'text': str, 'score': float} dict with scores in [0, 1].
+            Phrase scores are normalized over the returned phrases.
+    """
+    k = max(1, min(k, MAX_CANDIDATES))
+    if not text or not text.strip():
+        return {'tokens': [], 'phrases': [{'text': text, 'score': 1.0}]}
+    
+    candidates = _candidates_textblob if TEXTBLOB_AVAILABLE else _candidates_fallback
+    per_word = {}
+    tokens = []
+    for match in _iter_words(text):
+        word = match.group()
+        key = word.lower()
+        if key not in per_word:
+            per_word[key] = candidates(key, k)
+        pairs = [
+            (word if correct == key else _match_case(word, correct), score)
+            for correct, score in per_word[key]
+        ]
+        tokens.append((match.start(), match.end(), pairs))
+    
+    phrases = _top_phrases(text, tokens, k)
+    if not TEXTBLOB_AVAILABLE and text.lower() in CORRECTION_MAP:
+        # Whole-phrase dictionary hits win, as in correct_text()
+        known = CORRECTION_MAP[text.lower()]
+        others = [pair for pair in phrases if pair[0].lower() != known.lower()]
+        phrases = [(known, 1.0)] + others[:k - 1]
+    
+    total = sum(score for _, score in phrases)
+    phrases = [(phrase, score / total) for phrase, score in phrases]
+    
+    return {
+        'tokens': [
+            {
+                'token': text[start:end],
+                'start': start,
+                'end': end,
+                'candidates': _score_dicts(pairs),
+            }
+            for start, end, pairs in tokens
+        ],
+        'phrases': _score_dicts(phrases),
+    }
+
+
+def _top_phrases(text, tokens, k):
+    """Return the k best (phrase, score) combinations of token candidates.
+    
+    Token candidate lists are sorted best-first, so the best combinations are
+    enumerated lazily from a heap that grows by at most one entry per token
+    for every phrase taken. A phrase scores the product of its word scores.
+    """
+    if not tokens:
+        return [(text, 1.0)]
+    
+    def score(indices):
+        return math.prod(tokens[i][2][j][1] for i, j in enumerate(indices))
+    
+    first = (0,) * len(tokens)
+    heap = [(-score(first), first)]
+    seen = {first}
+    phrases = []
+    while heap and len(phrases) < k:
+        negative_score, indices = heapq.heappop(heap)
+        replacements = [
+            (start, end, pairs[j][0])
+            for (start, end, pairs), j in zip(tokens, indices)
+        ]
+        phrases.append((_splice(text, replacements), -negative_score))
+        
+        for i, j in enumerate(indices):
+            if j + 1 < len(tokens[i][2]):
+                following = indices[:i] + (j + 1,) + indices[i + 1:]
+                if following not in seen:
+                    seen.add(following)
+                    heapq.heappush(heap, (-score(following), following))
+    
+    return phrases
+
+
+def _score_dicts(pairs):
+    """Convert (text, score) pairs to JSON-friendly dicts."""
+    return [{'text': text, 'score': round(score, 4)} for text, score in pairs]
+
+
+def get_word_frequencies():
+    """Return the word model of the active backend as a word -> count dict.
+    
+    With TextBlob this is its English spelling model; the fallback backend
+    only knows the words on the corrected side of CORRECTION_MAP.
+    """
+    if TEXTBLOB_AVAILABLE:
+        return dict(TEXTBLOB_SPELLING.items())
+    
+    frequencies = {}
+    for correct in CORRECTION_MAP.values():
+        for word in _WORD_RE.findall(correct.lower()):
+            frequencies[word] = frequencies.get(word, 0) + 1
+    return frequencies
 
 
 def get_backend_info():
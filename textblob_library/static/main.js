@@ -171,6 +171,10 @@ async function loadDatasetStats() {
                         <div class="stat-value">${data.typo_types.extra_letters}</div>
                         <div class="stat-label">Extra Letters</div>
                     </div>
+                    <div class="stat-card">
+                        <div class="stat-value">${data.typo_types.swapped_letters}</div>
+                        <div class="stat-label">Swapped Letters</div>
+                    </div>
                     <div class="stat-card">
                         <div class="stat-value">${data.typo_types.wrong_letters}</div>
                         <div class="stat-label">Wrong Letters</div>
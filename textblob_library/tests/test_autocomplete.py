@@ -0,0 +1,82 @@
+"""Unit tests for the autocomplete module."""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import autocomplete module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autocomplete import PrefixTrie, build_suggestion_index, normalize_prefix
+
+
+class TestPrefixTrie(unittest.TestCase):
+    """Test cases for the compressed prefix trie."""
+    
+    def setUp(self):
+        """Build a small trie."""
+        self.trie = PrefixTrie(k=3)
+        for term, weight in [('glacier', 5), ('glacier bay toilet', 3), ('glass', 8),
+                             ('glue', 1), ('toilet', 7), ('toilet seat', 2)]:
+            self.trie.insert(term, weight)
+        self.trie.finalize()
+    
+    def texts(self, prefix, k=None):
+        return [s['text'] for s in self.trie.suggest(prefix, k)]
+    
+    def test_size(self):
+        """Test that every inserted term is counted once."""
+        self.trie.insert('glue', 4)
+        self.assertEqual(len(self.trie), 6)
+    
+    def test_ranked_by_weight(self):
+        """Test that suggestions are ordered by weight."""
+        self.assertEqual(self.texts('gl'), ['glass', 'glacier', 'glacier bay toilet'])
+    
+    def test_prefix_inside_edge(self):
+        """Test prefixes that end in the middle of a compressed edge."""
+        self.assertEqual(self.texts('glacier b'), ['glacier bay toilet'])
+        self.assertEqual(self.texts('toilet'), ['toilet', 'toilet seat'])
+    
+    def test_limit(self):
+        """Test that the number of suggestions is capped."""
+        self.assertEqual(self.texts('gl', 1), ['glass'])
+        self.assertEqual(len(self.texts('gl', 50)), 3)
+    
+    def test_one_edit(self):
+        """Test that prefixes with one typo still match."""
+        for prefix in ['glaicer', 'glacer', 'glaxier', 'glaccier', 'tiolet']:
+            suggestions = self.trie.suggest(prefix)
+            self.assertTrue(suggestions, prefix)
+            self.assertFalse(suggestions[0]['exact'])
+        self.assertIn('glacier', self.texts('glaicer'))
+        self.assertIn('toilet', self.texts('tiolet'))
+    
+    def test_exact_matches_first(self):
+        """Test that exact matches rank ahead of fuzzy ones."""
+        suggestions = self.trie.suggest('glu')
+        self.assertEqual(suggestions[0], {'text': 'glue', 'exact': True})
+        self.assertTrue(all(not s['exact'] for s in suggestions[1:]))
+    
+    def test_no_match(self):
+        """Test that unrelated prefixes return nothing."""
+        self.assertEqual(self.trie.suggest('zzzz'), [])
+
+
+class TestSuggestionIndex(unittest.TestCase):
+    """Test cases for building the index from the typo dataset."""
+    
+    def test_dataset_ranks_above_word_model(self):
+        """Test that corrected dataset phrases outrank model-only words."""
+        typo_dict = {'glaciar bay toiled': 'Glacier Bay Toilet'}
+        trie = build_suggestion_index(typo_dict, {'glad': 1000, 'glacier': 10})
+        texts = [s['text'] for s in trie.suggest('gla')]
+        self.assertEqual(texts, ['glacier', 'glacier bay toilet', 'glad'])
+    
+    def test_normalize_prefix(self):
+        """Test prefix normalization."""
+        self.assertEqual(normalize_prefix('  Gas   Wa'), 'gas wa')
+
+
+if __name__ == '__main__':
+    unittest.main()
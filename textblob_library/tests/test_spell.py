@@ -7,7 +7,9 @@ import os
 # Add parent directory to path to import spell module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from spell import correct_text, get_backend_info, TEXTBLOB_AVAILABLE
+from spell import (
+    correct_text, suggest_candidates, get_backend_info, TEXTBLOB_AVAILABLE, _correct_tokens
+)
 
 
 class TestSpellCorrection(unittest.TestCase):
@@ -64,6 +66,20 @@ class TestSpellCorrection(unittest.TestCase):
             # The corrected text should be different from the original
             # (unless TextBlob can't improve it, which is okay)
     
+    @unittest.skipUnless(TEXTBLOB_AVAILABLE, "TextBlob not installed")
+    def test_all_caps_words_unchanged(self):
+        """Test that TextBlob leaves acronyms and brand names alone."""
+        test_cases = [
+            ('PVC pipe', 'PVC pipe'),
+            ('OSB board', 'OSB board'),
+            ('GFCI outlet', 'GFCI outlet'),
+            ('DEWALT VACCUM', 'DEWALT VACCUM'),
+        ]
+        
+        for text, expected in test_cases:
+            self.assertEqual(correct_text(text), expected)
+            self.assertEqual(suggest_candidates(text, 3)['phrases'][0]['text'], expected)
+    
     def test_correction_map_entries(self):
         """Test that correction map entries work correctly."""
         # Test a few entries that should work with fallback
@@ -73,6 +89,114 @@ class TestSpellCorrection(unittest.TestCase):
             self.assertEqual(result.lower(), 'ceiling')
 
 
+class TestSuggestCandidates(unittest.TestCase):
+    """Test cases for top-k candidate suggestions."""
+    
+    def test_top_phrase_matches_correct_text(self):
+        """Test that the best phrase is what correct_text returns."""
+        for text in ['cieling', 'lawn mower- electic', 'Vynal Tolet seat',
+                     'HomeDepot', 'LaserJet printer', 'McDonald iPhone']:
+            result = suggest_candidates(text, 3)
+            self.assertEqual(result['phrases'][0]['text'], correct_text(text))
+    
+    def test_token_candidates(self):
+        """Test that every word gets ranked candidates with offsets."""
+        text = 'lawn mower- electic'
+        result = suggest_candidates(text, 3)
+        self.assertEqual([t['token'] for t in result['tokens']], ['lawn', 'mower', 'electic'])
+        for token in result['tokens']:
+            self.assertEqual(text[token['start']:token['end']], token['token'])
+            self.assertTrue(1 <= len(token['candidates']) <= 3)
+            scores = [c['score'] for c in token['candidates']]
+            self.assertEqual(scores, sorted(scores, reverse=True))
+            self.assertTrue(all(0 <= score <= 1 for score in scores))
+    
+    def test_phrases_bounded_by_k(self):
+        """Test that at most k distinct phrases are returned."""
+        result = suggest_candidates('flourescnt tolet', 2)
+        phrases = [p['text'] for p in result['phrases']]
+        self.assertTrue(1 <= len(phrases) <= 2)
+        self.assertEqual(len(phrases), len(set(phrases)))
+    
+    def test_phrase_scores_normalized(self):
+        """Test that phrase scores are positive and add up to 1."""
+        for text in ['celling light', 'metal plate cover gcfi', 'flourescnt tolet']:
+            scores = [p['score'] for p in suggest_candidates(text, 3)['phrases']]
+            self.assertTrue(all(score > 0 for score in scores), text)
+            self.assertAlmostEqual(sum(scores), 1.0, places=3, msg=text)
+    
+    @unittest.skipUnless(TEXTBLOB_AVAILABLE, "TextBlob not installed")
+    def test_unknown_words_keep_phrase_scores(self):
+        """Test that words TextBlob does not know do not zero out phrases."""
+        for text in ['glacier bay tolet', 'xqzvw faucet']:
+            result = suggest_candidates(text, 3)
+            scores = [p['score'] for p in result['phrases']]
+            self.assertTrue(all(score > 0 for score in scores), text)
+            self.assertAlmostEqual(sum(scores), 1.0, places=3, msg=text)
+            self.assertEqual(result['tokens'][0]['candidates'][0]['score'], 1.0)
+    
+    def test_dictionary_phrase_not_duplicated(self):
+        """Test that a whole-phrase hit is not repeated in a different case."""
+        phrases = [p['text'].lower() for p in suggest_candidates('Cieling', 3)['phrases']]
+        self.assertEqual(len(phrases), len(set(phrases)))
+        self.assertEqual(phrases[0], 'ceiling')
+    
+    def test_empty_text(self):
+        """Test that empty text yields no tokens."""
+        result = suggest_candidates('', 3)
+        self.assertEqual(result['tokens'], [])
+        self.assertEqual(result['phrases'], [{'text': '', 'score': 1.0}])
+
+
+class TestTokenizer(unittest.TestCase):
+    """Test cases for the shared word tokenizer."""
+    
+    @staticmethod
+    def fake_corrector(word):
+        """Correct a small fixed vocabulary."""
+        return {'electic': 'electric', 'tolet': 'toilet'}.get(word, word)
+    
+    def test_preserves_punctuation(self):
+        """Test that hyphens and punctuation survive correction."""
+        result = _correct_tokens('lawn mower- electic, 2 pack!', self.fake_corrector)
+        self.assertEqual(result, 'lawn mower- electric, 2 pack!')
+    
+    def test_preserves_case(self):
+        """Test that capitalization is carried over to corrections."""
+        self.assertEqual(_correct_tokens('Electic', self.fake_corrector), 'Electric')
+    
+    def test_skips_all_caps_tokens(self):
+        """Test that acronyms and brand names are not passed to the corrector."""
+        seen = []
+        result = _correct_tokens('ELECTIC PVC tolet', lambda word: seen.append(word) or word)
+        self.assertEqual(seen, ['tolet'])
+        self.assertEqual(result, 'ELECTIC PVC tolet')
+        self.assertEqual(_correct_tokens('ELECTIC', self.fake_corrector), 'ELECTIC')
+    
+    def test_skips_non_alphabetic_tokens(self):
+        """Test that model numbers and digits are not passed to the corrector."""
+        seen = []
+        _correct_tokens('faucet g135 6 tier', lambda word: seen.append(word) or word)
+        self.assertEqual(seen, ['faucet', 'tier'])
+    
+    def test_repeated_tokens_corrected_once(self):
+        """Test that repeated words only hit the corrector once."""
+        seen = []
+        
+        def corrector(word):
+            seen.append(word)
+            return self.fake_corrector(word)
+        
+        result = _correct_tokens('tolet seat, Tolet lid', corrector)
+        self.assertEqual(result, 'toilet seat, Toilet lid')
+        self.assertEqual(seen.count('tolet'), 1)
+    
+    def test_unchanged_text_is_returned_as_is(self):
+        """Test that text needing no correction is returned unchanged."""
+        text = 'steel stake'
+        self.assertIs(_correct_tokens(text, self.fake_corrector), text)
+
+
 class TestAppIntegration(unittest.TestCase):
     """Test cases for Flask app integration."""
     
@@ -111,6 +235,33 @@ class TestAppIntegration(unittest.TestCase):
         self.assertIn('backend', data)
         self.assertEqual(data['original'], 'test text')
     
+    def test_api_candidates(self):
+        """Test API candidate suggestions."""
+        response = self.client.post('/api/candidates',
+                                   json={'text': 'cieling fan', 'k': 3})
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['original'], 'cieling fan')
+        self.assertEqual(len(data['tokens']), 2)
+        self.assertTrue(1 <= len(data['phrases']) <= 3)
+    
+    def test_api_candidates_invalid_k(self):
+        """Test API candidate suggestions with a non-integer k."""
+        for k in ['three', None, [3]]:
+            response = self.client.post('/api/candidates',
+                                       json={'text': 'cieling fan', 'k': k})
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('error', response.get_json())
+    
+    def test_api_suggest(self):
+        """Test API autocomplete suggestions."""
+        response = self.client.get('/api/suggest?q=Glacier&limit=3')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['prefix'], 'glacier')
+        self.assertLessEqual(len(data['suggestions']), 3)
+        self.assertTrue(data['suggestions'][0]['text'].startswith('glacier'))
+    
     def test_api_correct_missing_text(self):
         """Test API correction with missing text field."""
         response = self.client.post('/api/correct', json={})
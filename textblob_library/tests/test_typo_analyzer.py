@@ -0,0 +1,91 @@
+"""Unit tests for the typo dataset analyzer."""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import typo_analyzer module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typo_analyzer import TypoDataset, get_dataset_statistics
+
+
+SAMPLE = {
+    'gas mowe': 'gas mower',           # missing letter
+    'storage shelve': 'storage shelf',  # extra letter
+    'tiolet': 'toilet',                # swapped letters
+    'Tolet Seat': 'toilet seat',       # missing letter, case ignored
+    'gcfi': 'gfci',                    # swapped letters
+    'vynal': 'vinyl',                  # wrong letters
+}
+
+
+class TestTypoDataset(unittest.TestCase):
+    """Test cases for the columnar dataset."""
+
+    def setUp(self):
+        """Build a small dataset."""
+        self.dataset = TypoDataset.from_dict(SAMPLE)
+
+    def test_columns(self):
+        """Test that the columns line up with the entries."""
+        self.assertEqual(len(self.dataset), 6)
+        self.assertEqual(list(self.dataset.token_counts), [2, 2, 1, 2, 1, 1])
+        self.assertEqual(list(self.dataset.typo_lengths), [len(t) for t in SAMPLE])
+        self.assertEqual(self.dataset.vocabulary[:3], ['gas', 'mowe', 'storage'])
+
+    def test_blank_typos(self):
+        """Test token counts for empty and whitespace-only typos."""
+        dataset = TypoDataset.from_dict({'': 'a', '  ': 'b', 'Door  knob': 'door knob', 'door': 'door'})
+        self.assertEqual(list(dataset.token_counts), [0, 0, 2, 1])
+        self.assertEqual(dataset.vocabulary, ['door', 'knob'])
+        self.assertEqual(list(dataset.token_ids), [0, 1, 0])
+
+    def test_edit_distances(self):
+        """Test case-insensitive Levenshtein distances."""
+        self.assertEqual(list(self.dataset.edit_distances), [1, 2, 2, 1, 2, 2])
+
+    def test_lowercasing_changes_length(self):
+        """Test characters whose lowercase form is longer than themselves."""
+        dataset = TypoDataset.from_dict({'\u0130\u0130\u0130x': 'i\u0307i\u0307i\u0307x'})
+        self.assertEqual(list(dataset.edit_distances), [0])
+
+    def test_typo_types(self):
+        """Test that transpositions are counted as swapped letters."""
+        self.assertEqual(self.dataset.typo_type_counts(), {
+            'missing_letters': 2,
+            'extra_letters': 1,
+            'swapped_letters': 2,
+            'wrong_letters': 1,
+        })
+
+    def test_common_words(self):
+        """Test word counts, with ties in first-seen order."""
+        dataset = TypoDataset.from_dict({'door knob': 'door knob', 'Door hinge': 'door hinge'})
+        self.assertEqual(dataset.common_words(2), [('door', 2), ('knob', 1)])
+
+    def test_statistics(self):
+        """Test the statistics summary."""
+        stats = get_dataset_statistics(SAMPLE)
+        self.assertEqual(stats['total_entries'], 6)
+        self.assertEqual(stats['single_word_typos'], 3)
+        self.assertEqual(stats['multi_word_typos'], 3)
+        self.assertEqual(stats['avg_words_per_typo'], 1.5)
+        self.assertEqual(stats['edit_distance_histogram'], [
+            {'distance': 1, 'count': 2},
+            {'distance': 2, 'count': 4},
+        ])
+
+    def test_statistics_method(self):
+        """Test that the dataset method matches the dict wrapper."""
+        self.assertEqual(self.dataset.statistics(), get_dataset_statistics(SAMPLE))
+
+    def test_empty_dataset(self):
+        """Test statistics of an empty dataset."""
+        stats = get_dataset_statistics({})
+        self.assertEqual(stats['total_entries'], 0)
+        self.assertEqual(stats['common_words'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,25 @@
-"""Module to parse and analyze the typo dataset."""
+"""Module to parse and analyze the typo dataset.
+
+Statistics are computed on a columnar TypoDataset: per-entry lengths and
+token counts live in NumPy arrays and typo tokens are interned to integer
+ids, so each statistic is a vectorized pass. Character-level analysis
+(edit distances, swapped letters) runs over fixed-size chunks of entries
+to keep memory bounded on large corpora.
+"""
 
 import re
-from collections import Counter
+import numpy as np
+
 from spell import correct_text
 
 
+# Number of entries encoded at once for character-level analysis
+CHUNK_SIZE = 4096
+
+# Joins typos for bulk tokenization; the NUL sentinel never occurs in queries
+_ENTRY_SEPARATOR = ' \0 '
+
+
 def parse_typo_file(filepath='typo.txt'):
     """Parse the typo.txt file and return a dictionary of typo -> correct mappings.
     
@@ -31,53 +46,232 @@ def parse_typo_file(filepath='typo.txt'):
     return typo_dict
 
 
-def get_dataset_statistics(typo_dict):
-    """Calculate statistics about the typo dataset.
+class TypoDataset:
+    """Columnar representation of a typo -> correct dataset.
     
-    Returns:
-        dict: Statistics about the dataset
+    Attributes:
+        typos (list): Typo strings, in dataset order
+        corrections (list): Corrected strings, aligned with typos
+        typo_lengths (np.ndarray): Character length of every typo
+        correct_lengths (np.ndarray): Character length of every correction
+        token_counts (np.ndarray): Number of words in every typo
+        token_ids (np.ndarray): Interned ids of all lowercased typo words
+        vocabulary (list): Word for every token id, in first-seen order
     """
-    total_entries = len(typo_dict)
-    
-    # Calculate average word count
-    typo_word_counts = [len(typo.split()) for typo in typo_dict.keys()]
-    avg_words_typo = sum(typo_word_counts) / len(typo_word_counts) if typo_word_counts else 0
-    
-    # Count single vs multi-word typos
-    single_word = sum(1 for typo in typo_dict.keys() if len(typo.split()) == 1)
-    multi_word = total_entries - single_word
-    
-    # Common typo patterns
-    typo_types = {
-        'missing_letters': 0,
-        'extra_letters': 0,
-        'swapped_letters': 0,
-        'wrong_letters': 0
-    }
     
-    for typo, correct in typo_dict.items():
-        if len(typo) < len(correct):
-            typo_types['missing_letters'] += 1
-        elif len(typo) > len(correct):
-            typo_types['extra_letters'] += 1
-        else:
-            typo_types['wrong_letters'] += 1
+    def __init__(self, typos, corrections):
+        self.typos = list(typos)
+        self.corrections = list(corrections)
+        
+        count = len(self.typos)
+        self.typo_lengths = np.fromiter(map(len, self.typos), dtype=np.int32, count=count)
+        self.correct_lengths = np.fromiter(map(len, self.corrections), dtype=np.int32, count=count)
+        
+        # Lowercase and split all typos in one go, with a NUL sentinel word in
+        # front of every entry to mark where its words start
+        words = _ENTRY_SEPARATOR.join([''] + self.typos).lower().split()
+        
+        # Intern words in first-seen order; the sentinel, if any, gets id 0
+        word_ids = {word: i for i, word in enumerate(dict.fromkeys(words))}
+        ids = np.fromiter(map(word_ids.__getitem__, words), dtype=np.int32, count=len(words))
+        
+        starts = np.flatnonzero(ids == 0) if count else np.empty(0, dtype=np.intp)
+        self.token_counts = (np.diff(np.append(starts, len(words))) - 1).astype(np.int32)
+        self.token_ids = ids[ids != 0] - 1 if count else ids
+        self.vocabulary = list(word_ids)[1:] if count else []
+        
+        self._edit_distances = None
+        self._swapped = None
+    
+    @classmethod
+    def from_dict(cls, typo_dict):
+        """Build a dataset from 'typo': 'correct' pairs."""
+        return cls(typo_dict.keys(), typo_dict.values())
     
-    # Find common words in typos
-    all_words = []
-    for typo in typo_dict.keys():
-        all_words.extend(typo.lower().split())
+    def __len__(self):
+        return len(self.typos)
     
-    common_words = Counter(all_words).most_common(10)
+    @property
+    def edit_distances(self):
+        """Levenshtein distance between every typo and its correction."""
+        if self._edit_distances is None:
+            self._analyze_characters()
+        return self._edit_distances
     
-    return {
-        'total_entries': total_entries,
-        'single_word_typos': single_word,
-        'multi_word_typos': multi_word,
-        'avg_words_per_typo': round(avg_words_typo, 2),
-        'typo_types': typo_types,
-        'common_words': [{'word': word, 'count': count} for word, count in common_words]
-    }
+    @property
+    def swapped(self):
+        """Whether every typo is its correction with two adjacent letters swapped."""
+        if self._swapped is None:
+            self._analyze_characters()
+        return self._swapped
+    
+    def _analyze_characters(self):
+        """Compute edit distances and swaps, CHUNK_SIZE entries at a time.
+        
+        Strings are compared case-insensitively. Entries are processed in
+        order of length so that each chunk needs little padding; lengths are
+        re-measured after lowercasing, which can add code points ('İ').
+        """
+        count = len(self)
+        distances = np.zeros(count, dtype=np.int32)
+        swapped = np.zeros(count, dtype=bool)
+        
+        order = np.argsort(np.maximum(self.typo_lengths, self.correct_lengths), kind='stable')
+        for start in range(0, count, CHUNK_SIZE):
+            indices = order[start:start + CHUNK_SIZE]
+            lowered_typos = [self.typos[i].lower() for i in indices]
+            lowered_corrections = [self.corrections[i].lower() for i in indices]
+            typo_lengths = _lengths(lowered_typos)
+            correct_lengths = _lengths(lowered_corrections)
+            typos = _encode(lowered_typos, typo_lengths.max())
+            corrections = _encode(lowered_corrections, correct_lengths.max())
+            
+            distances[indices] = _levenshtein(typos, typo_lengths, corrections, correct_lengths)
+            swapped[indices] = _adjacent_swaps(typos, typo_lengths, corrections, correct_lengths)
+        
+        self._edit_distances = distances
+        self._swapped = swapped
+    
+    def typo_type_counts(self):
+        """Classify every entry by how its typo differs from the correction.
+        
+        Returns:
+            dict: Entry counts per typo type
+        """
+        missing = self.typo_lengths < self.correct_lengths
+        extra = self.typo_lengths > self.correct_lengths
+        swapped = self.swapped & ~missing & ~extra
+        
+        return {
+            'missing_letters': int(np.count_nonzero(missing)),
+            'extra_letters': int(np.count_nonzero(extra)),
+            'swapped_letters': int(np.count_nonzero(swapped)),
+            'wrong_letters': len(self) - int(np.count_nonzero(missing | extra | swapped))
+        }
+    
+    def common_words(self, count=10):
+        """Return the most frequent typo words as (word, count) pairs.
+        
+        Ties keep first-seen order, matching collections.Counter.
+        """
+        frequencies = np.bincount(self.token_ids, minlength=len(self.vocabulary))
+        top = np.argsort(-frequencies, kind='stable')[:count]
+        return [(self.vocabulary[i], int(frequencies[i])) for i in top]
+    
+    def edit_distance_histogram(self):
+        """Return the number of entries at every edit distance."""
+        histogram = np.bincount(self.edit_distances)
+        return [(distance, int(n)) for distance, n in enumerate(histogram) if n]
+    
+    def statistics(self):
+        """Calculate statistics about the dataset.
+        
+        Returns:
+            dict: Statistics about the dataset
+        """
+        total_entries = len(self)
+        if not total_entries:
+            return {
+                'total_entries': 0,
+                'single_word_typos': 0,
+                'multi_word_typos': 0,
+                'avg_words_per_typo': 0,
+                'avg_edit_distance': 0,
+                'typo_types': self.typo_type_counts(),
+                'edit_distance_histogram': [],
+                'common_words': []
+            }
+        
+        single_word = int(np.count_nonzero(self.token_counts == 1))
+        
+        return {
+            'total_entries': total_entries,
+            'single_word_typos': single_word,
+            'multi_word_typos': total_entries - single_word,
+            'avg_words_per_typo': round(float(self.token_counts.mean()), 2),
+            'avg_edit_distance': round(float(self.edit_distances.mean()), 2),
+            'typo_types': self.typo_type_counts(),
+            'edit_distance_histogram': [
+                {'distance': distance, 'count': count}
+                for distance, count in self.edit_distance_histogram()
+            ],
+            'common_words': [
+                {'word': word, 'count': count} for word, count in self.common_words(10)
+            ]
+        }
+
+
+def _lengths(strings):
+    """Return the lengths of strings as an int32 array."""
+    return np.fromiter(map(len, strings), dtype=np.int32, count=len(strings))
+
+
+def _encode(strings, width):
+    """Encode strings as rows of code points, zero-padded to width."""
+    width = max(int(width), 1)
+    encoded = np.array(strings, dtype=f'<U{width}')
+    return encoded.view(np.uint32).reshape(len(strings), width)
+
+
+def _levenshtein(a, a_lengths, b, b_lengths):
+    """Vectorized Levenshtein distances between aligned rows of a and b.
+    
+    The DP table is filled one row of a at a time for the whole batch. Within
+    a row, insertions are resolved with a running minimum, using
+    D[i][j] = j + min(D'[i][k] - k for k <= j).
+    """
+    rows = a.shape[0]
+    # Distances never exceed the longer string, so short strings fit in int16
+    dtype = np.int16 if max(a.shape[1], b.shape[1]) < np.iinfo(np.int16).max else np.int32
+    columns = np.arange(b.shape[1] + 1, dtype=dtype)
+    previous = np.broadcast_to(columns, (rows, columns.size)).copy()
+    
+    distances = np.empty(rows, dtype=np.int32)
+    done = a_lengths == 0
+    distances[done] = b_lengths[done]
+    
+    for i in range(1, int(a_lengths.max()) + 1):
+        substitution = (a[:, i - 1, None] != b).astype(dtype)
+        current = np.empty_like(previous)
+        current[:, 0] = i
+        np.minimum(previous[:, 1:] + 1, previous[:, :-1] + substitution, out=current[:, 1:])
+        current = np.minimum.accumulate(current - columns, axis=1) + columns
+        
+        done = a_lengths == i
+        distances[done] = current[done, b_lengths[done]]
+        previous = current
+    
+    return distances
+
+
+def _adjacent_swaps(a, a_lengths, b, b_lengths):
+    """Flag rows where a equals b with exactly two adjacent letters swapped."""
+    width = min(a.shape[1], b.shape[1])
+    swapped = np.zeros(a.shape[0], dtype=bool)
+    if width < 2:
+        return swapped
+    
+    mismatched = a[:, :width] != b[:, :width]
+    candidates = np.flatnonzero((a_lengths == b_lengths) & (mismatched.sum(axis=1) == 2))
+    first = mismatched[candidates].argmax(axis=1)
+    second = np.minimum(first + 1, width - 1)
+    
+    swapped[candidates] = (
+        mismatched[candidates, second]
+        & (second > first)
+        & (a[candidates, first] == b[candidates, second])
+        & (a[candidates, second] == b[candidates, first])
+    )
+    return swapped
+
+
+def get_dataset_statistics(typo_dict):
+    """Calculate statistics about the typo dataset.
+    
+    Returns:
+        dict: Statistics about the dataset, see TypoDataset.statistics()
+    """
+    return TypoDataset.from_dict(typo_dict).statistics()
 
 
 def get_random_samples(typo_dict, count=10):